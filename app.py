@@ -1,12 +1,24 @@
 import dash
 from dash import dcc, html
-from dash.dependencies import Input, Output
+from dash.dependencies import Input, Output, State, ClientsideFunction
 import dash_bootstrap_components as dbc
+from flask import request
+from flask_caching import Cache
+from flask_compress import Compress
+
+import os
 
 import geopandas as gpd
-import plotly.express as px
-import json
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import get_colorscale
+import numpy as np
+import orjson
 import pandas as pd
+import threading
+import topojson
+from joblib import Parallel, delayed
+from shapely.geometry import mapping
 
 # Initialize the Dash app with Bootstrap theme and suppress callback exceptions
 app = dash.Dash(
@@ -21,6 +33,27 @@ app.title = "NC Health Insights Dashboard"  # Updated Title
 # Server for deployment (if needed)
 server = app.server
 
+# Flask-Caching filesystem cache, shared by all gunicorn workers on the host;
+# the data is static so cached entries never expire
+cache = Cache(server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': '/tmp/nc-health-cache',
+    'CACHE_DEFAULT_TIMEOUT': 0
+})
+
+# Compress responses with Brotli (gzip fallback); callback responses are JSON
+# dominated by repeated digits and transfer at a fraction of their raw size
+server.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+server.config['COMPRESS_MIN_SIZE'] = 500
+Compress(server)
+
+# Static assets only change with a deploy, so let browsers cache them hard
+@server.after_request
+def add_asset_cache_headers(response):
+    if request.path.startswith('/assets/'):
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
 # ---------------------------
 # Define Health Categories
 # ---------------------------
@@ -124,254 +157,207 @@ health_categories = {
 # Data Loading and Processing
 # ---------------------------
 
-# Initialize GeoDataFrame and GeoJSON
+# Initialize GeoDataFrame and GeoJSON. The heavy structures below are
+# populated by load_data() on first use (see ensure_loaded) rather than at
+# import time, so worker startup stays near-instant and a preloading
+# deployment can pay the cost once before forking.
 merged_nc = gpd.GeoDataFrame()
 merged_geojson = {}
 featureidkey = 'properties.County'  # Default featureidkey
+county_locations = np.array([])  # County join keys, in row order
+INDICATOR_STATS = {}  # {indicator: (vmin, vmax, median-imputed float32 array)}
+FIGURE_CACHE = {}  # {indicator: geojson-free map figure dict}
+INDICATOR_DATA = {}  # {indicator: county/value pairs for the clientside bars}
+
+_load_lock = threading.Lock()
+_loaded = False
+
+# Recursively round GeoJSON coordinates; ~4 decimals (roughly 11 m) is more
+# precision than a state-wide map at zoom 6 can resolve, and shorter numbers
+# shrink the payload considerably
+def round_coordinates(coords):
+    if isinstance(coords[0], (int, float)):
+        return [round(c, 4) for c in coords]
+    return [round_coordinates(c) for c in coords]
+
+# Load the source GeoJSON and build every derived structure (simplified
+# geometry, GeoJSON dict, prepacked indicator arrays, precomputed figures).
+# Deferred to first use so import stays cheap; the figure helpers it calls
+# are defined in the next section.
+def load_data():
+    global merged_nc, merged_geojson, featureidkey, county_locations, _loaded
 
-try:
-    # Load the GeoJSON file named 'merged_nc.geojson'
-    merged_nc = gpd.read_file('merged_nc.geojson')
-    print("GeoJSON file 'merged_nc.geojson' loaded successfully.")
-except FileNotFoundError:
-    print("Error: GeoJSON file 'merged_nc.geojson' not found. Please check the file path.")
-except Exception as e:
-    print(f"Error loading GeoJSON: {e}")
-
-# Proceed only if GeoDataFrame is not empty
-if not merged_nc.empty:
-    # Ensure CRS is WGS84
-    if merged_nc.crs != "EPSG:4326":
-        merged_nc = merged_nc.to_crs(epsg=4326)
-        print("CRS converted to EPSG:4326.")
-
-    # Simplify geometry for performance
     try:
-        merged_nc['geometry'] = merged_nc['geometry'].simplify(tolerance=0.01, preserve_topology=True)
-        print("Geometry simplified.")
+        # Load the GeoJSON file named 'merged_nc.geojson'
+        merged_nc = gpd.read_file('merged_nc.geojson')
+        print("GeoJSON file 'merged_nc.geojson' loaded successfully.")
+    except FileNotFoundError:
+        print("Error: GeoJSON file 'merged_nc.geojson' not found. Please check the file path.")
     except Exception as e:
-        print(f"Error simplifying geometry: {e}")
-
-    # Convert to GeoJSON
-    try:
-        merged_geojson = json.loads(merged_nc.to_json())
-        print("Converted GeoDataFrame to GeoJSON.")
-    except Exception as e:
-        print(f"Error converting to GeoJSON: {e}")
-        merged_geojson = {}
-
-    # Check uniqueness of 'County'
-    if 'County' in merged_nc.columns:
-        unique_counties = merged_nc['County'].nunique()
-        total_counties = len(merged_nc)
-        print(f"Unique counties: {unique_counties} out of {total_counties} total entries.")
-
-        if unique_counties != total_counties:
-            merged_nc['County_ID'] = merged_nc['County'].astype(str) + "_" + merged_nc.index.astype(str)
-            featureidkey = 'properties.County_ID'
-            merged_geojson = json.loads(merged_nc.to_json())
-            print("Created unique County_ID.")
+        print(f"Error loading GeoJSON: {e}")
+
+    # Proceed only if GeoDataFrame is not empty
+    if not merged_nc.empty:
+        # Ensure CRS is WGS84
+        if merged_nc.crs != "EPSG:4326":
+            merged_nc = merged_nc.to_crs(epsg=4326)
+            print("CRS converted to EPSG:4326.")
+
+        # Simplify geometry for performance; county polygons at zoom 6 carry far
+        # more vertex detail than the viewport can resolve. Building a topology
+        # first stores each border shared by two counties as a single arc, so
+        # simplification keeps neighboring counties aligned instead of opening
+        # gaps between them, and halves the vertex count on interior borders.
+        try:
+            topo = topojson.Topology(merged_nc, prequantize=True, toposimplify=0.03)
+            merged_nc = topo.to_gdf().set_crs(epsg=4326, allow_override=True)
+            print("Geometry simplified via shared-border topology.")
+        except Exception as e:
+            print(f"Error building topology ({e}); falling back to per-polygon simplify.")
+            try:
+                # Plain Douglas-Peucker: the rendering-only counties don't
+                # self-intersect, so the slower topology-preserving GEOS
+                # simplifier buys nothing on this fallback path
+                merged_nc['geometry'] = merged_nc['geometry'].simplify(tolerance=0.03, preserve_topology=False)
+                print("Geometry simplified.")
+            except Exception as e:
+                print(f"Error simplifying geometry: {e}")
+
+        # Check uniqueness of 'County'
+        if 'County' in merged_nc.columns:
+            unique_counties = merged_nc['County'].nunique()
+            total_counties = len(merged_nc)
+            print(f"Unique counties: {unique_counties} out of {total_counties} total entries.")
+
+            if unique_counties != total_counties:
+                merged_nc['County_ID'] = merged_nc['County'].astype(str) + "_" + merged_nc.index.astype(str)
+                featureidkey = 'properties.County_ID'
+                print("Created unique County_ID.")
+            else:
+                print("County names are unique.")
         else:
-            print("County names are unique.")
+            print("Error: 'County' column not found in GeoDataFrame.")
+            featureidkey = 'properties.County'
+
+        # Convert to GeoJSON, keeping only the key columns the choropleth joins on
+        # (the full frame is kept for analytics) and rounding coordinate
+        # precision. Building the dict feature-by-feature with shapely's
+        # mapping() skips the to_json()/json.loads() round trip that
+        # serialized the whole frame to a string only to parse it right back.
+        try:
+            property_columns = [c for c in ('County', 'County_ID') if c in merged_nc.columns]
+            features = []
+            for row in merged_nc.itertuples(index=False):
+                geometry = mapping(row.geometry)
+                geometry['coordinates'] = round_coordinates(geometry['coordinates'])
+                features.append({
+                    "type": "Feature",
+                    "geometry": geometry,
+                    "properties": {c: getattr(row, c) for c in property_columns}
+                })
+            merged_geojson = {"type": "FeatureCollection", "features": features}
+            print("Converted GeoDataFrame to GeoJSON.")
+        except Exception as e:
+            print(f"Error converting to GeoJSON: {e}")
+            merged_geojson = {}
+
+        # Convert health indicator columns to float32. Some indicators appear in
+        # more than one category (e.g. "% Adults with Obesity"), so deduplicate
+        # first to avoid re-parsing the same column. float32's ~7 significant
+        # digits is ample precision for percentages and rates at half the memory.
+        # Columns geopandas already parsed as numeric take a straight cast; object
+        # columns get one vectorized regex clean before casting, with
+        # pd.to_numeric kept as the fallback for anything genuinely dirty.
+        indicator_columns = sorted(
+            {var for variables in health_categories.values() for var in variables} & set(merged_nc.columns)
+        )
+        for var in indicator_columns:
+            col = merged_nc[var]
+            if pd.api.types.is_numeric_dtype(col):
+                merged_nc[var] = col.to_numpy().astype(np.float32, copy=False)
+            else:
+                try:
+                    cleaned = col.astype(str).str.replace(r'[^\d.\-]', '', regex=True).replace('', np.nan)
+                    merged_nc[var] = cleaned.astype(np.float32)
+                except (TypeError, ValueError):
+                    merged_nc[var] = pd.to_numeric(col, errors='coerce', downcast='float')
+        print(f"Converted {len(indicator_columns)} health indicator columns to float32.")
+
+        # Prepack each indicator column as a contiguous float32 array with NaNs
+        # filled by the median, alongside its (vmin, vmax) color range. One pass
+        # per indicator here means the figure builder never copies the frame or
+        # rescans a column.
+        county_locations = merged_nc['County' if 'County' in merged_nc.columns else 'County_ID'].to_numpy()
+        for var in indicator_columns:
+            arr = merged_nc[var].to_numpy(dtype=np.float32)
+            if np.isnan(arr).any():
+                arr = np.nan_to_num(arr, nan=np.nanmedian(arr))
+            INDICATOR_STATS[var] = (float(arr.min()), float(arr.max()), arr)
+        print(f"Prepacked value arrays for {len(INDICATOR_STATS)} indicators.")
+
+        # Precompute all map figures and bar-chart data so the indicator
+        # callbacks are dictionary lookups. The indicator set is small and
+        # the data is static, so this trades a few seconds of load time for
+        # near-zero callback latency. Figures are stored already run through
+        # Plotly's JSON encoder (see build_indicator_figures), so responses
+        # only re-serialize plain dicts. INDICATOR_DATA ships to the browser
+        # once via a dcc.Store and feeds the clientside bar-chart callbacks.
+        all_indicators = []
+        for variables in health_categories.values():
+            for indicator in variables:
+                if indicator not in all_indicators:
+                    all_indicators.append(indicator)  # Some indicators appear in more than one category
+        present = [ind for ind in all_indicators if ind in merged_nc.columns]
+
+        # Fan the independent per-indicator builds out across cores. The
+        # fork-based backend lets workers read merged_geojson and the
+        # prepacked arrays as inherited globals instead of pickling them per
+        # task; only the finished figure dicts travel back.
+        results = Parallel(n_jobs=-1, backend='multiprocessing')(
+            delayed(build_indicator_figures)(indicator) for indicator in present
+        )
+        for indicator, (map_fig, bar_data) in zip(present, results):
+            FIGURE_CACHE[indicator] = map_fig
+            INDICATOR_DATA[indicator] = bar_data
+        for indicator in all_indicators:
+            if indicator not in FIGURE_CACHE:
+                FIGURE_CACHE[indicator] = make_message_figure(
+                    f"Indicator '{indicator}' not found in the data.",
+                    f"Indicator '{indicator}' not found."
+                )
+        print(f"Precomputed figures for {len(FIGURE_CACHE)} indicators.")
     else:
-        print("Error: 'County' column not found in GeoDataFrame.")
-        featureidkey = 'properties.County'
-
-    # Convert health indicator columns to numeric
-    for category, variables in health_categories.items():
-        for var in variables:
-            if var in merged_nc.columns:
-                merged_nc[var] = pd.to_numeric(merged_nc[var], errors='coerce')
-    print("Converted health indicator columns to numeric where applicable.")
-else:
-    print("GeoDataFrame is empty. Please check your GeoJSON file.")
+        print("GeoDataFrame is empty. Please check your GeoJSON file.")
 
-# ---------------------------
-# Layout Definition
-# ---------------------------
+    _loaded = True
 
-# Define the app layout with Navbar, Header, Tabs, Dropdown, Map, Bar Charts, Readme Tab, and Footer
-app.layout = dbc.Container([
-    # Navigation Bar
-    dbc.NavbarSimple(
-        brand="NC Health Insights Dashboard",  # Updated Title
-        brand_href="#",
-        color="primary",
-        dark=True,
-        className="mb-4"
-    ),
-    # Header and Description
-    dbc.Row([
-        dbc.Col([
-            html.H2("Health and Socioeconomic Indicators in North Carolina", className='text-center'),
-            html.P(
-                "Explore various health and socioeconomic indicators across North Carolina counties. "
-                "Select a category and an indicator to visualize the spatial distribution and gain insights into the factors affecting health outcomes.",
-                className='text-center'
-            )
-        ])
-    ], className='mb-4'),
-    # Main Tabs for Readme and Categories
-    dbc.Row([
-        dbc.Col([
-            dcc.Tabs(id='main-tabs', value='Readme', children=[  # Readme as first tab and default
-                dcc.Tab(label="Readme", value='Readme', className='custom-tab', selected_className='custom-tab--selected'),
-                dcc.Tab(label="Economic Stability", value='Economic Stability', className='custom-tab', selected_className='custom-tab--selected'),
-                dcc.Tab(label="Education Access and Quality", value='Education Access and Quality', className='custom-tab', selected_className='custom-tab--selected'),
-                dcc.Tab(label="Health Care Access and Quality", value='Health Care Access and Quality', className='custom-tab', selected_className='custom-tab--selected'),
-                dcc.Tab(label="Neighborhood and Built Environment", value='Neighborhood and Built Environment', className='custom-tab', selected_className='custom-tab--selected'),
-                dcc.Tab(label="Social and Community Context", value='Social and Community Context', className='custom-tab', selected_className='custom-tab--selected'),
-                dcc.Tab(label="Health Outcomes", value='Health Outcomes', className='custom-tab', selected_className='custom-tab--selected'),
-                dcc.Tab(label="Behavioral Factors", value='Behavioral Factors', className='custom-tab', selected_className='custom-tab--selected')
-            ], className='custom-tabs', parent_className='custom-tabs-container')
-        ])
-    ], className='mb-4'),
-    # Content Area for Tabs
-    dbc.Row([
-        dbc.Col([
-            # Dynamic content based on selected tab
-            html.Div(id='tab-content')
-        ])
-    ]),
-    # Footer
-    dbc.Row([
-        dbc.Col([
-            html.Hr(),
-            html.P(
-                "Data Source: 2024 County Health Rankings & Roadmaps",
-                className='text-center'
-            ),
-            html.P(
-                "Developed with ❤️ using Dash and Plotly.",
-                className='text-center'
-            )
-        ])
-    ], className='mt-4')
-], fluid=True)
+# Pay the one-time load under a lock so concurrent first requests load once
+def ensure_loaded():
+    if not _loaded:
+        with _load_lock:
+            if not _loaded:
+                load_data()
 
 # ---------------------------
-# Callbacks
+# Figure Precomputation
 # ---------------------------
 
-# Callback to render content based on selected main tab
-@app.callback(
-    Output('tab-content', 'children'),
-    [Input('main-tabs', 'value')]
-)
-def render_tab_content(selected_tab):
-    if selected_tab == 'Readme':
-        return dbc.Container([
-            dbc.Row([
-                dbc.Col([
-                    dcc.Markdown(
-                        """
-                        ## Overview
-
-                        The **NC Health Insights Dashboard** provides a comprehensive view of various health and socioeconomic indicators across North Carolina counties. By leveraging the 2024 County Health Rankings & Roadmaps datasets, this dashboard offers insights into the factors influencing health outcomes within the state.
-
-                        ## Data Source
-
-                        - **Dataset:** 2024 County Health Rankings & Roadmaps
-                        - **Description:** This dataset encompasses a wide range of health factors and outcomes that are critical in assessing the overall health status of counties in North Carolina.
-
-                        ## Methodology
-
-                        To analyze the data through the lens of Social Determinants of Health (SDOH), the following steps were undertaken:
-
-                        1. **Data Extraction:**
-                           - Extracted **87** of health factors and outcomes relevant to the study.
-
-                        2. **Topic Modeling:**
-                           - Utilized a **Large Language Model (LLM): ChatGPT 01-mini** to perform topic modeling.
-                           - Classified the extracted health outcomes and factors into established SDOH categories, facilitating a structured analysis.
-
-                        ## Features
-
-                        - **Interactive Map:** Visualizes the spatial distribution of selected health indicators across North Carolina counties.
-                        - **Bar Charts:** Displays the Top 10 and Bottom 10 counties based on the chosen indicator, allowing for quick comparative analysis.
-                        - **Readme Tab:** Provides detailed information about the dashboard, data sources, and methodologies used.
+# Resolve the Viridis colorscale into an explicit stop list once, instead of
+# having Plotly re-resolve the name inside every figure build. The clientside
+# bar charts use the matching 10-color ramp hardcoded in assets/bars.js.
+VIRIDIS_SCALE = get_colorscale('Viridis')
 
-                        ## Usage
-
-                        1. **Select a Category:** Navigate to one of the category tabs (e.g., Economic Stability, Education Access and Quality).
-                        2. **Choose an Indicator:** Within a category, select a specific health indicator from the dropdown menu.
-                        3. **View Visualizations:** Explore the choropleth map and bar charts to gain insights into the performance of different counties.
-
-                        ## Contact
-
-                        For any inquiries or feedback, please contact Yared Hurisa at yaredlema@gmail.com.
-                        """
-                    )
-                ])
-            ])
-        ], fluid=True)
-    else:
-        # Category Tabs Content
-        category = selected_tab
-        return [
-            # Dropdown for Indicator Selection
-            dbc.Row([
-                dbc.Col([
-                    html.Label("Select Indicator:", className='font-weight-bold'),
-                    dcc.Dropdown(
-                        id='indicator-dropdown',
-                        options=[{'label': indicator, 'value': indicator} for indicator in health_categories[category]],
-                        value=health_categories[category][0] if health_categories[category] else None,
-                        multi=False,
-                        clearable=False,
-                        placeholder="Choose an indicator..."
-                    )
-                ], width=6, md=4)
-            ], className='mb-4'),
-            # Map Display with Loading Indicator
-            dbc.Row([
-                dbc.Col([
-                    dcc.Loading(
-                        id="loading-map",
-                        type="circle",
-                        children=dcc.Graph(id='indicator-map')
-                    )
-                ])
-            ]),
-            # Top and Bottom Bar Charts Display with Loading Indicators
-            dbc.Row([
-                dbc.Col([
-                    html.H4("Top 10 Counties", className='text-center mb-2'),
-                    dcc.Loading(
-                        id="loading-bar-top",
-                        type="circle",
-                        children=dcc.Graph(id='bar-chart-top')
-                    )
-                ], md=6),
-                dbc.Col([
-                    html.H4("Bottom 10 Counties", className='text-center mb-2'),
-                    dcc.Loading(
-                        id="loading-bar-bottom",
-                        type="circle",
-                        children=dcc.Graph(id='bar-chart-bottom')
-                    )
-                ], md=6)
-            ], className='mt-4')
-        ]
-
-# Callback to update the Map and both Bar Charts based on selected Indicator
-@app.callback(
-    [Output('indicator-map', 'figure'),
-     Output('bar-chart-top', 'figure'),
-     Output('bar-chart-bottom', 'figure')],
-    [Input('indicator-dropdown', 'value')]
-)
-def update_visualizations(selected_indicator):
-    # Initialize empty figures with messages
-    empty_figure = {
+# Build a blank figure that displays a message (used for missing selections and errors)
+def make_message_figure(title, text):
+    return {
         "data": [],
         "layout": {
-            "title": "Please select an indicator to display the visualizations.",
+            "title": title,
             "xaxis": {"visible": False},
             "yaxis": {"visible": False},
             "annotations": [
                 {
-                    "text": "No indicator selected.",
+                    "text": text,
                     "xref": "paper",
                     "yref": "paper",
                     "showarrow": False,
@@ -381,197 +367,310 @@ def update_visualizations(selected_indicator):
         }
     }
 
-    if not selected_indicator:
-        return empty_figure, empty_figure, empty_figure
-
-    # Check if the indicator exists in the DataFrame
-    if selected_indicator not in merged_nc.columns:
-        error_figure = {
-            "data": [],
-            "layout": {
-                "title": f"Indicator '{selected_indicator}' not found in the data.",
-                "xaxis": {"visible": False},
-                "yaxis": {"visible": False},
-                "annotations": [
-                    {
-                        "text": f"Indicator '{selected_indicator}' not found.",
-                        "xref": "paper",
-                        "yref": "paper",
-                        "showarrow": False,
-                        "font": {"size": 20}
-                    }
-                ]
-            }
-        }
-        return error_figure, error_figure, error_figure
-
-    # Handle missing data by filling with the median
-    merged_nc_clean = merged_nc.copy()
-    if merged_nc_clean[selected_indicator].isnull().any():
-        median_val = merged_nc_clean[selected_indicator].median()
-        merged_nc_clean[selected_indicator] = merged_nc_clean[selected_indicator].fillna(median_val)
-
-    # Create choropleth map
+# Build the choropleth map and the bar-chart data for a single indicator.
+# Memoized through the shared filesystem cache so that with multiple gunicorn
+# workers only the first to start pays the precompute; the rest read the
+# stored results from disk.
+@cache.memoize()
+def build_indicator_figures(indicator):
+    # Prepacked values for this indicator: NaNs already imputed with the
+    # median, color range already reduced (see INDICATOR_STATS)
+    vmin, vmax, vals = INDICATOR_STATS[indicator]
+
+    # Create choropleth map directly from arrays; building the trace with
+    # go.Choroplethmapbox skips Plotly Express's per-call dataframe
+    # introspection (column detection, labels, hover metadata)
     try:
-        map_fig = px.choropleth_mapbox(
-            merged_nc_clean,
+        map_fig = go.Figure(go.Choroplethmapbox(
             geojson=merged_geojson,
-            locations='County' if 'County' in merged_nc_clean.columns else 'County_ID',
-            color=selected_indicator,
-            color_continuous_scale="Viridis",
-            range_color=(merged_nc_clean[selected_indicator].min(), merged_nc_clean[selected_indicator].max()),
-            mapbox_style="carto-positron",
-            zoom=6,
-            center={"lat": 35.7596, "lon": -79.0193},  # Center on NC
-            opacity=0.7,
-            labels={selected_indicator: selected_indicator},
+            locations=county_locations,
+            z=vals,
             featureidkey=featureidkey,
-            hover_data=['County', selected_indicator]  # Add more fields as needed
-        )
-        map_fig.update_layout(
-            margin={"r":0,"t":0,"l":0,"b":0},
-            coloraxis_colorbar=dict(
-                title=selected_indicator,
+            colorscale=VIRIDIS_SCALE,
+            zmin=vmin,
+            zmax=vmax,
+            marker_opacity=0.7,
+            hovertemplate="County=%{location}<br>" + indicator + "=%{z}<extra></extra>",
+            colorbar=dict(
+                title=indicator,
                 ticksuffix="%"
             )
+        ))
+        map_fig.update_layout(
+            mapbox_style="carto-positron",
+            mapbox_zoom=6,
+            mapbox_center={"lat": 35.7596, "lon": -79.0193},  # Center on NC
+            margin={"r":0,"t":0,"l":0,"b":0}
         )
+        map_fig = orjson.loads(pio.to_json(map_fig))
+        # The geojson travels to the client exactly once via the
+        # geojson-store and is merged back into the figure clientside
+        # (assets/map.js), so strip it from the cached figure rather than
+        # resending it with every map response
+        for trace in map_fig.get('data', []):
+            trace.pop('geojson', None)
     except Exception as e:
-        map_fig = {
-            "data": [],
-            "layout": {
-                "title": "Error creating the choropleth map.",
-                "xaxis": {"visible": False},
-                "yaxis": {"visible": False},
-                "annotations": [
-                    {
-                        "text": "An error occurred while creating the map.",
-                        "xref": "paper",
-                        "yref": "paper",
-                        "showarrow": False,
-                        "font": {"size": 20}
-                    }
-                ]
-            }
-        }
-
-    # Prepare data for Top 10 Bar Chart
-    try:
-        top_n = 10
-        merged_nc_top = merged_nc_clean.nlargest(top_n, selected_indicator)
-        bar_top_fig = px.bar(
-            merged_nc_top,
-            x='County' if 'County' in merged_nc_top.columns else 'County_ID',
-            y=selected_indicator,
-            orientation='v',  # Vertical bars
-            title=f"Top {top_n} Counties by {selected_indicator}",
-            labels={'County': 'County', selected_indicator: selected_indicator},
-            height=600,
-            color=selected_indicator,
-            color_continuous_scale="Viridis"
-        )
-        bar_top_fig.update_layout(
-            margin={"r":50,"t":50,"l":100,"b":300},  # Increased bottom margin for label readability
-            xaxis_title="County",
-            yaxis_title=selected_indicator,
-            xaxis=dict(
-                tickangle=-45,          # Rotate x-axis labels for readability
-                tickmode='array',       # Ensures that only the Top 10 counties are labeled
-                tickvals=merged_nc_top['County'],  # Specific tick values
-                ticktext=merged_nc_top['County']   # Specific tick labels
-            ),
-            yaxis=dict(
-                tickmode='auto',        # Let Plotly decide tick placement
-                nticks=5,               # Limit number of Y-axis ticks
-                zeroline=False,         # Remove the zeroline
-                showgrid=True,          # Show gridlines for better readability
-                ticks='outside',        # Position ticks outside the axis
-                ticklen=5,              # Length of the ticks
-                tickwidth=1,            # Width of the ticks
-                tickcolor='black',      # Color of the ticks
-                showticklabels=True    # Ensure tick labels are shown
-            )
+        map_fig = make_message_figure(
+            "Error creating the choropleth map.",
+            "An error occurred while creating the map."
         )
-    except Exception as e:
-        bar_top_fig = {
-            "data": [],
-            "layout": {
-                "title": f"Error creating the Top {top_n} bar chart.",
-                "xaxis": {"visible": False},
-                "yaxis": {"visible": False},
-                "annotations": [
-                    {
-                        "text": f"An error occurred while creating the Top {top_n} bar chart.",
-                        "xref": "paper",
-                        "yref": "paper",
-                        "showarrow": False,
-                        "font": {"size": 20}
-                    }
-                ]
-            }
-        }
 
-    # Prepare data for Bottom 10 Bar Chart
-    try:
-        bottom_n = 10
-        merged_nc_bottom = merged_nc_clean.nsmallest(bottom_n, selected_indicator)
-        bar_bottom_fig = px.bar(
-            merged_nc_bottom,
-            x='County' if 'County' in merged_nc_bottom.columns else 'County_ID',
-            y=selected_indicator,
-            orientation='v',  # Vertical bars
-            title=f"Bottom {bottom_n} Counties by {selected_indicator}",
-            labels={'County': 'County', selected_indicator: selected_indicator},
-            height=600,
-            color=selected_indicator,
-            color_continuous_scale="Viridis"
+    # County/value pairs for the clientside Top/Bottom 10 bar charts. The
+    # browser sorts and slices these in assets/bars.js, so no bar figure is
+    # built or serialized server-side.
+    bar_data = {
+        'counties': county_locations.tolist(),
+        'values': [float(v) for v in vals]
+    }
+
+    return map_fig, bar_data
+
+# ---------------------------
+# Layout Definition
+# ---------------------------
+
+# Readme tab content
+README_TEXT = """
+## Overview
+
+The **NC Health Insights Dashboard** provides a comprehensive view of various health and socioeconomic indicators across North Carolina counties. By leveraging the 2024 County Health Rankings & Roadmaps datasets, this dashboard offers insights into the factors influencing health outcomes within the state.
+
+## Data Source
+
+- **Dataset:** 2024 County Health Rankings & Roadmaps
+- **Description:** This dataset encompasses a wide range of health factors and outcomes that are critical in assessing the overall health status of counties in North Carolina.
+
+## Methodology
+
+To analyze the data through the lens of Social Determinants of Health (SDOH), the following steps were undertaken:
+
+1. **Data Extraction:**
+   - Extracted **87** of health factors and outcomes relevant to the study.
+
+2. **Topic Modeling:**
+   - Utilized a **Large Language Model (LLM): ChatGPT 01-mini** to perform topic modeling.
+   - Classified the extracted health outcomes and factors into established SDOH categories, facilitating a structured analysis.
+
+## Features
+
+- **Interactive Map:** Visualizes the spatial distribution of selected health indicators across North Carolina counties.
+- **Bar Charts:** Displays the Top 10 and Bottom 10 counties based on the chosen indicator, allowing for quick comparative analysis.
+- **Readme Tab:** Provides detailed information about the dashboard, data sources, and methodologies used.
+
+## Usage
+
+1. **Select a Category:** Navigate to one of the category tabs (e.g., Economic Stability, Education Access and Quality).
+2. **Choose an Indicator:** Within a category, select a specific health indicator from the dropdown menu.
+3. **View Visualizations:** Explore the choropleth map and bar charts to gain insights into the performance of different counties.
+
+## Contact
+
+For any inquiries or feedback, please contact Yared Hurisa at yaredlema@gmail.com.
+"""
+
+# Define the app layout with Navbar, Header, Tabs, Dropdown, Map, Bar Charts, Readme Tab, and Footer.
+# The layout is a function so Dash builds it per page load: the first page
+# load triggers the lazy data load, and the stores always embed the loaded
+# data.
+def serve_layout():
+    ensure_loaded()
+    return dbc.Container([
+        # Navigation Bar
+        dbc.NavbarSimple(
+            brand="NC Health Insights Dashboard",  # Updated Title
+            brand_href="#",
+            color="primary",
+            dark=True,
+            className="mb-4"
+        ),
+        # Header and Description
+        dbc.Row([
+            dbc.Col([
+                html.H2("Health and Socioeconomic Indicators in North Carolina", className='text-center'),
+                html.P(
+                    "Explore various health and socioeconomic indicators across North Carolina counties. "
+                    "Select a category and an indicator to visualize the spatial distribution and gain insights into the factors affecting health outcomes.",
+                    className='text-center'
+                )
+            ])
+        ], className='mb-4'),
+        # Main Tabs for Readme and Categories
+        dbc.Row([
+            dbc.Col([
+                # Readme first and default; category tabs generated from health_categories
+                dcc.Tabs(id='main-tabs', value='Readme', children=[
+                    dcc.Tab(label=tab, value=tab, className='custom-tab', selected_className='custom-tab--selected')
+                    for tab in ['Readme', *health_categories]
+                ], className='custom-tabs', parent_className='custom-tabs-container')
+            ])
+        ], className='mb-4'),
+        # Content Area for Tabs. Both panes are mounted exactly once and
+        # toggled via style, so switching tabs never tears down and
+        # re-mounts the graph components.
+        dbc.Row([
+            dbc.Col([
+                # Readme pane
+                html.Div(id='readme-content', children=dbc.Container([
+                    dbc.Row([
+                        dbc.Col([
+                            dcc.Markdown(README_TEXT)
+                        ])
+                    ])
+                ], fluid=True)),
+                # Category pane; the tab callback fills in the dropdown
+                html.Div(id='category-content', style={'display': 'none'}, children=[
+                    # Dropdown for Indicator Selection
+                    dbc.Row([
+                        dbc.Col([
+                            html.Label("Select Indicator:", className='font-weight-bold'),
+                            dcc.Dropdown(
+                                id='indicator-dropdown',
+                                options=[],
+                                value=None,
+                                multi=False,
+                                clearable=False,
+                                placeholder="Choose an indicator..."
+                            )
+                        ], width=6, md=4)
+                    ], className='mb-4'),
+                    # Map and Bar Charts under a single Loading Indicator;
+                    # one spinner component and callback-status subscription
+                    # instead of three per-graph ones
+                    dcc.Loading(
+                        id="loading-figures",
+                        type="circle",
+                        children=[
+                            # Map Display
+                            dbc.Row([
+                                dbc.Col([
+                                    dcc.Graph(id='indicator-map')
+                                ])
+                            ]),
+                            # Top and Bottom Bar Charts Display
+                            dbc.Row([
+                                dbc.Col([
+                                    html.H4("Top 10 Counties", className='text-center mb-2'),
+                                    dcc.Graph(id='bar-chart-top')
+                                ], md=6),
+                                dbc.Col([
+                                    html.H4("Bottom 10 Counties", className='text-center mb-2'),
+                                    dcc.Graph(id='bar-chart-bottom')
+                                ], md=6)
+                            ], className='mt-4')
+                        ]
+                    )
+                ])
+            ])
+        ]),
+        # County/value pairs per indicator, sent to the browser once and read by
+        # the clientside bar-chart callbacks in assets/bars.js
+        dcc.Store(id='indicator-data', data=INDICATOR_DATA),
+        # County boundaries, sent to the browser once; the clientside callback in
+        # assets/map.js merges them into each map figure before rendering
+        dcc.Store(id='geojson-store', data=merged_geojson),
+        # Geojson-free map figure produced by the server callback, consumed by
+        # the clientside merge
+        dcc.Store(id='map-figure-store'),
+        # Footer
+        dbc.Row([
+            dbc.Col([
+                html.Hr(),
+                html.P(
+                    "Data Source: 2024 County Health Rankings & Roadmaps",
+                    className='text-center'
+                ),
+                html.P(
+                    "Developed with ❤️ using Dash and Plotly.",
+                    className='text-center'
+                )
+            ])
+        ], className='mt-4')
+    ], fluid=True)
+
+app.layout = serve_layout
+
+# ---------------------------
+# Callbacks
+# ---------------------------
+
+# Callback to switch between the Readme and category panes and repoint the
+# indicator dropdown. The panes and graphs live in the layout permanently and
+# are only shown/hidden, so a tab switch costs a style flip and a dropdown
+# update instead of a full DOM teardown and Plotly re-mount.
+@app.callback(
+    [Output('readme-content', 'style'),
+     Output('category-content', 'style'),
+     Output('indicator-dropdown', 'options'),
+     Output('indicator-dropdown', 'value')],
+    [Input('main-tabs', 'value')]
+)
+def switch_tab(selected_tab):
+    if selected_tab == 'Readme':
+        return {}, {'display': 'none'}, [], None
+
+    indicators = health_categories.get(selected_tab, [])
+    options = [{'label': indicator, 'value': indicator} for indicator in indicators]
+    return {'display': 'none'}, {}, options, indicators[0] if indicators else None
+
+# Callback to update the Map based on selected Indicator; all map figures are
+# precomputed at startup, so this is a dictionary access. The figure carries
+# no geojson -- it lands in the map-figure-store and the clientside callback
+# below merges in the boundaries from the geojson-store before rendering.
+@app.callback(
+    Output('map-figure-store', 'data'),
+    [Input('indicator-dropdown', 'value')]
+)
+def update_map(selected_indicator):
+    ensure_loaded()  # No-op except on a fresh worker
+    if not selected_indicator:
+        return make_message_figure(
+            "Please select an indicator to display the visualizations.",
+            "No indicator selected."
         )
-        bar_bottom_fig.update_layout(
-            margin={"r":50,"t":50,"l":100,"b":300},  # Increased bottom margin for label readability
-            xaxis_title="County",
-            yaxis_title=selected_indicator,
-            xaxis=dict(
-                tickangle=-45,          # Rotate x-axis labels for readability
-                tickmode='array',       # Ensures that only the Bottom 10 counties are labeled
-                tickvals=merged_nc_bottom['County'],  # Specific tick values
-                ticktext=merged_nc_bottom['County']   # Specific tick labels
-            ),
-            yaxis=dict(
-                tickmode='auto',        # Let Plotly decide tick placement
-                nticks=5,               # Limit number of Y-axis ticks
-                zeroline=False,         # Remove the zeroline
-                showgrid=True,          # Show gridlines for better readability
-                ticks='outside',        # Position ticks outside the axis
-                ticklen=5,              # Length of the ticks
-                tickwidth=1,            # Width of the ticks
-                tickcolor='black',      # Color of the ticks
-                showticklabels=True    # Ensure tick labels are shown
-            )
+    if selected_indicator not in FIGURE_CACHE:
+        return make_message_figure(
+            f"Indicator '{selected_indicator}' not found in the data.",
+            f"Indicator '{selected_indicator}' not found."
         )
-    except Exception as e:
-        bar_bottom_fig = {
-            "data": [],
-            "layout": {
-                "title": f"Error creating the Bottom {bottom_n} bar chart.",
-                "xaxis": {"visible": False},
-                "yaxis": {"visible": False},
-                "annotations": [
-                    {
-                        "text": f"An error occurred while creating the Bottom {bottom_n} bar chart.",
-                        "xref": "paper",
-                        "yref": "paper",
-                        "showarrow": False,
-                        "font": {"size": 20}
-                    }
-                ]
-            }
-        }
+    return FIGURE_CACHE[selected_indicator]
+
+# Merge the stored geojson into the incoming map figure clientside
+app.clientside_callback(
+    ClientsideFunction(namespace='map', function_name='mergeGeojson'),
+    Output('indicator-map', 'figure'),
+    [Input('map-figure-store', 'data')],
+    [State('geojson-store', 'data')]
+)
+
+# The Top/Bottom 10 bar charts are built in the browser (assets/bars.js) from
+# the county/value pairs already shipped in the indicator-data store: a sort
+# and slice of 100 values, with no server round trip per dropdown change.
+app.clientside_callback(
+    ClientsideFunction(namespace='bars', function_name='topN'),
+    Output('bar-chart-top', 'figure'),
+    [Input('indicator-dropdown', 'value')],
+    [State('indicator-data', 'data')]
+)
 
-    return map_fig, bar_top_fig, bar_bottom_fig
+app.clientside_callback(
+    ClientsideFunction(namespace='bars', function_name='bottomN'),
+    Output('bar-chart-bottom', 'figure'),
+    [Input('indicator-dropdown', 'value')],
+    [State('indicator-data', 'data')]
+)
 
 # ---------------------------
 # Run the Dash App
 # ---------------------------
+# Under `gunicorn --preload` (see Procfile) this module is imported once in
+# the master process, so loading here lets every forked worker share the
+# parsed geojson and figure caches as copy-on-write pages instead of
+# rebuilding them per worker. Nothing mutates these structures after load, so
+# the pages stay shared. PRELOAD_DATA is set in the Procfile; without it
+# (plain `gunicorn app:server`, local dev) loading stays lazy.
+if os.environ.get('PRELOAD_DATA'):
+    ensure_loaded()
+
 if __name__ == '__main__':
-    import os
     port = int(os.environ.get('PORT', 8050))
     app.run_server(debug=True, host='0.0.0.0', port=port)
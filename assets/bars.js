@@ -0,0 +1,122 @@
+/* Clientside builders for the Top/Bottom 10 bar charts.
+ *
+ * The indicator-data dcc.Store already holds every (county, value) pair for
+ * every indicator, so the browser can sort, slice and build the bar figure
+ * itself -- no server round trip or server-side figure construction per
+ * dropdown change.
+ */
+
+function ncMessageFigure(title, text) {
+    return {
+        data: [],
+        layout: {
+            title: title,
+            xaxis: { visible: false },
+            yaxis: { visible: false },
+            annotations: [
+                {
+                    text: text,
+                    xref: "paper",
+                    yref: "paper",
+                    showarrow: false,
+                    font: { size: 20 }
+                }
+            ]
+        }
+    };
+}
+
+/* Viridis sampled at 10 evenly spaced points
+ * (plotly.colors.sample_colorscale("Viridis", [i / 9 for i in range(10)])).
+ * Fixed per-rank colors keep the Viridis look without shipping a coloraxis
+ * block or paying Plotly's continuous-scale mapping for 10 bars.
+ */
+var NC_VIRIDIS10 = [
+    "rgb(68, 1, 84)",
+    "rgb(72, 40, 120)",
+    "rgb(62, 73, 137)",
+    "rgb(49, 104, 142)",
+    "rgb(38, 130, 142)",
+    "rgb(31, 158, 137)",
+    "rgb(53, 183, 121)",
+    "rgb(110, 206, 88)",
+    "rgb(181, 222, 43)",
+    "rgb(253, 231, 37)"
+];
+
+function ncBarFigure(indicator, data, top) {
+    var n = 10;
+
+    if (!indicator) {
+        return ncMessageFigure(
+            "Please select an indicator to display the visualizations.",
+            "No indicator selected."
+        );
+    }
+    if (!data || !data[indicator]) {
+        return ncMessageFigure(
+            "Indicator '" + indicator + "' not found in the data.",
+            "Indicator '" + indicator + "' not found."
+        );
+    }
+
+    var counties = data[indicator].counties;
+    var values = data[indicator].values;
+
+    // Sort county indices by value (descending for Top, ascending for
+    // Bottom) and keep the first n
+    var order = counties.map(function (_, i) { return i; });
+    order.sort(function (a, b) {
+        return top ? values[b] - values[a] : values[a] - values[b];
+    });
+    order = order.slice(0, n);
+
+    var x = order.map(function (i) { return counties[i]; });
+    var y = order.map(function (i) { return values[i]; });
+    var title = (top ? "Top " : "Bottom ") + n + " Counties by " + indicator;
+
+    return {
+        data: [
+            {
+                type: "bar",
+                x: x,
+                y: y,
+                marker: { color: NC_VIRIDIS10 }
+            }
+        ],
+        layout: {
+            title: title,
+            height: 600,
+            margin: { r: 50, t: 50, l: 100, b: 300 },  // Room for rotated county labels
+            xaxis: {
+                title: "County",
+                tickangle: -45,
+                tickmode: "array",
+                tickvals: x,
+                ticktext: x
+            },
+            yaxis: {
+                title: indicator,
+                nticks: 5,
+                zeroline: false,
+                showgrid: true,
+                ticks: "outside",
+                ticklen: 5,
+                tickwidth: 1,
+                tickcolor: "black",
+                showticklabels: true
+            }
+        }
+    };
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    bars: {
+        topN: function (selectedIndicator, data) {
+            return ncBarFigure(selectedIndicator, data, true);
+        },
+        bottomN: function (selectedIndicator, data) {
+            return ncBarFigure(selectedIndicator, data, false);
+        }
+    }
+});
@@ -0,0 +1,23 @@
+/* Clientside merge of the county boundaries into the map figure.
+ *
+ * The geojson-store ships the county boundaries to the browser exactly once;
+ * the server's map callback returns figures without a geojson so each
+ * indicator change transfers only the values, not the polygons.
+ */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    map: {
+        mergeGeojson: function (figure, geojson) {
+            if (!figure) {
+                return window.dash_clientside.no_update;
+            }
+            var data = (figure.data || []).map(function (trace) {
+                if (trace.type === "choroplethmapbox") {
+                    return Object.assign({}, trace, { geojson: geojson });
+                }
+                return trace;
+            });
+            return Object.assign({}, figure, { data: data });
+        }
+    }
+});